@@ -1,6 +1,7 @@
 import http.server
 import os
 import socketserver
+import tempfile
 import webbrowser
 from urllib.parse import parse_qs, urlparse
 
@@ -34,52 +35,78 @@ SCOPE = "tasks:read tasks:write"
 STATE = "random-string-for-security"
 PORT = 8080
 
+# Canned pages returned to the browser, each sent with a single write.
+SUCCESS_PAGE = (
+    b"<html><head><title>Authentication Successful</title></head>"
+    b"<body style='font-family: sans-serif; text-align: center;'>"
+    b"<h1>Authentication Successful!</h1>"
+    b"<p>You can now close this browser window and return to the terminal.</p>"
+    b"</body></html>"
+)
+FAILURE_PAGE = (
+    b"<h1>Authentication Failed</h1><p>Could not find an authorization code in the request. Please try again.</p>"
+)
+
 # This global variable will be used to pass the authorization code from the server handler to the main script.
 authorization_code = None
-server_is_running = True
 
 
-class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
+class OAuthCallbackServer(socketserver.TCPServer):
+    """
+    A single-purpose server that stops as soon as the OAuth redirect has been handled.
+    """
+
+    allow_reuse_address = True
+    callback_handled = False
+
+
+class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
     """
     A simple HTTP request handler that captures the OAuth 'code' from the redirect.
     """
 
     def do_GET(self):
-        global authorization_code, server_is_running
+        global authorization_code
 
-        # Parse the query parameters from the request URL
-        query_components = parse_qs(urlparse(self.path).query)
+        # Parse the request URL; anything other than the redirect target (e.g. /favicon.ico) is ignored
+        parsed_url = urlparse(self.path)
+        if parsed_url.path != "/":
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        query_components = parse_qs(parsed_url.query)
 
         if "code" in query_components:
             authorization_code = query_components["code"][0]
             # Send a success response to the browser
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(b"<html><head><title>Authentication Successful</title></head>")
-            self.wfile.write(b"<body style='font-family: sans-serif; text-align: center;'>")
-            self.wfile.write(b"<h1>Authentication Successful!</h1>")
-            self.wfile.write(b"<p>You can now close this browser window and return to the terminal.</p>")
-            self.wfile.write(b"</body></html>")
+            self._send_page(200, SUCCESS_PAGE)
         else:
             # Handle the case where the 'code' is not in the query parameters
-            self.send_response(400)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(b"<h1>Authentication Failed</h1>")
-            self.wfile.write(b"<p>Could not find an authorization code in the request. Please try again.</p>")
+            self._send_page(400, FAILURE_PAGE)
 
         # Signal the server to stop
-        server_is_running = False
+        self.server.callback_handled = True
+
+    def _send_page(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep the terminal output limited to our own progress messages.
+        return
 
 
 def get_new_access_token():
     """
     Orchestrates the OAuth 2.0 Authorization Code Grant flow.
     """
-    global server_is_running, authorization_code
+    global authorization_code
 
-    with socketserver.TCPServer(("", PORT), OAuthCallbackHandler) as httpd:
+    with OAuthCallbackServer(("", PORT), OAuthCallbackHandler) as httpd:
         print(f"Temporarily starting a local web server on port {PORT}...")
 
         # 1. Construct the authorization URL and open it in the user's browser.
@@ -92,7 +119,8 @@ def get_new_access_token():
         webbrowser.open(auth_request_url)
 
         # 2. Wait for the server to handle the redirect and capture the code.
-        while server_is_running:
+        #    Stray requests (favicon, preflight) are answered and skipped; we stop on the redirect itself.
+        while not httpd.callback_handled:
             httpd.handle_request()
 
     if not authorization_code:
@@ -136,17 +164,25 @@ def get_new_access_token():
     print("Updating .env file with the new access token...")
     env_file_path = ".env"
 
-    # Read the existing .env file, filtering out the old access token
+    # Stream the existing .env into a temp file, dropping the old access token, then swap it in
+    # atomically so a crash mid-write never leaves a truncated .env behind.
+    env_dir = os.path.dirname(os.path.abspath(env_file_path))
+    tmp = tempfile.NamedTemporaryFile(mode="w", delete=False, dir=env_dir)
     try:
-        with open(env_file_path) as f:
-            lines = [line for line in f.readlines() if not line.strip().startswith("TICKTICK_ACCESS_TOKEN")]
-    except FileNotFoundError:
-        lines = []
-
-    # Write back the filtered lines plus the new access token
-    with open(env_file_path, "w") as f:
-        f.writelines(lines)
-        f.write(f"TICKTICK_ACCESS_TOKEN={access_token}\n")
+        with tmp:
+            try:
+                with open(env_file_path) as src:
+                    for line in src:
+                        if not line.lstrip().startswith("TICKTICK_ACCESS_TOKEN"):
+                            tmp.write(line)
+            except FileNotFoundError:
+                pass
+            tmp.write(f"TICKTICK_ACCESS_TOKEN={access_token}\n")
+        os.replace(tmp.name, env_file_path)
+    except BaseException:
+        # Don't leave a half-written temp file next to the .env.
+        os.unlink(tmp.name)
+        raise
 
     print(f"Successfully updated '{env_file_path}'. You can now use this token for API calls.")
 
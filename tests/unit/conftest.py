@@ -21,6 +21,7 @@ from mcp_app.context import current_user
 from mcp_app.models import UserRecord
 
 from ticktick import Profile  # noqa: F401  — kept for tests that import the model
+from ticktick.sdk import client, tasks
 
 
 @pytest.fixture(autouse=True)
@@ -35,6 +36,16 @@ def isolate_xdg(tmp_path, monkeypatch):
         (tmp_path / sub).mkdir(parents=True, exist_ok=True)
 
 
+@pytest.fixture(autouse=True)
+def empty_sdk_caches():
+    """Start every test without tasks or responses cached by earlier tests."""
+    tasks.clear_task_cache()
+    client.clear_response_cache()
+    yield
+    tasks.clear_task_cache()
+    client.clear_response_cache()
+
+
 @pytest.fixture
 def authenticated_user():
     """Set current_user to a test user with a valid TickTick token.
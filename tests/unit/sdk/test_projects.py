@@ -4,10 +4,14 @@ Sociable: real httpx client, real SDK logic, real Pydantic Profile.
 The only mocked boundary is the TickTick API itself (respx).
 """
 
+import asyncio
+import threading
+
 import httpx
 import pytest
 import respx
 
+from ticktick.sdk import client as client_module
 from ticktick.sdk import projects
 from ticktick.sdk.client import APIError, AuthenticationError, TickTickClient
 
@@ -96,3 +100,104 @@ async def test_client_raises_api_error_on_500():
     )
     with pytest.raises(APIError):
         await projects.list_projects(TickTickClient(token="t"))
+
+
+@respx.mock
+async def test_clients_share_one_pooled_http_client():
+    """Every TickTickClient on a loop reuses the same connection pool."""
+    route = respx.get("https://api.ticktick.com/open/v1/project").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    await projects.list_projects(TickTickClient(token="a"))
+    pooled = client_module._http_client()
+    await projects.list_projects(TickTickClient(token="b"))
+    assert client_module._http_client() is pooled
+    assert route.calls[1].request.headers["User-Agent"] == client_module.USER_AGENT
+    assert route.calls[1].request.headers["Authorization"] == "Bearer b"
+
+
+@respx.mock
+async def test_cookies_set_for_one_user_are_not_sent_for_another():
+    route = respx.get("https://api.ticktick.com/open/v1/project").mock(
+        return_value=httpx.Response(200, json=[], headers={"Set-Cookie": "sess=alice-session; Path=/"})
+    )
+    await projects.list_projects(TickTickClient(token="alice"))
+    await projects.list_projects(TickTickClient(token="bob"))
+    assert "Cookie" not in route.calls[1].request.headers
+
+
+async def test_each_running_loop_keeps_its_own_pooled_client():
+    """A second loop gets its own pool and leaves this loop's pool open."""
+    mine = client_module._http_client()
+    other = asyncio.new_event_loop()
+    worker = threading.Thread(target=other.run_forever, daemon=True)
+    worker.start()
+    try:
+        theirs = asyncio.run_coroutine_threadsafe(_make_pooled_client(), other).result(timeout=1)
+        assert theirs is not mine
+        assert client_module._http_client() is mine
+        again = asyncio.run_coroutine_threadsafe(_make_pooled_client(), other).result(timeout=1)
+        assert again is theirs
+        assert not mine.is_closed and not theirs.is_closed
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        worker.join()
+        other.close()
+
+
+async def _make_pooled_client():
+    return client_module._http_client()
+
+
+@respx.mock
+async def test_repeat_get_revalidates_with_etag_and_reuses_body_on_304():
+    route = respx.get("https://api.ticktick.com/open/v1/project").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"id": "p1", "name": "Work"}], headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+    client = TickTickClient(token="t")
+    first = await projects.list_projects(client)
+    second = await projects.list_projects(client)
+    assert second == first == [{"id": "p1", "name": "Work"}]
+    assert "If-None-Match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@respx.mock
+async def test_etag_cache_is_not_shared_between_tokens():
+    route = respx.get("https://api.ticktick.com/open/v1/project").mock(
+        return_value=httpx.Response(200, json=[], headers={"ETag": '"v1"'})
+    )
+    await projects.list_projects(TickTickClient(token="alice"))
+    await projects.list_projects(TickTickClient(token="bob"))
+    assert "If-None-Match" not in route.calls[1].request.headers
+
+
+@respx.mock
+async def test_body_served_from_304_is_a_private_copy():
+    respx.get("https://api.ticktick.com/open/v1/project").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"id": "p1", "name": "Work"}], headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+            httpx.Response(304),
+        ]
+    )
+    client = TickTickClient(token="t")
+    first = await projects.list_projects(client)
+    first[0]["name"] = "mutated"
+    second = await projects.list_projects(client)
+    second.append({"id": "p2"})
+    assert await projects.list_projects(client) == [{"id": "p1", "name": "Work"}]
+
+
+@respx.mock
+async def test_project_data_is_not_etag_cached():
+    route = respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(200, json={"tasks": []}, headers={"ETag": '"v1"'})
+    )
+    client = TickTickClient(token="t")
+    await projects.get_project_data(client, "p1")
+    await projects.get_project_data(client, "p1")
+    assert "If-None-Match" not in route.calls[1].request.headers
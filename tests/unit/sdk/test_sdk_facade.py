@@ -96,3 +96,41 @@ async def test_facade_create_task_returns_success_envelope(authenticated_user):
     assert result["success"] is True
     assert result["task"]["title"] == "Buy milk"
     assert "Buy milk" in result["message"]
+
+
+@respx.mock
+async def test_facade_bulk_complete_tasks_splits_completed_and_failed(authenticated_user):
+    respx.post("https://api.ticktick.com/open/v1/project/p1/task/t1/complete").mock(
+        return_value=httpx.Response(200)
+    )
+    respx.post("https://api.ticktick.com/open/v1/project/p1/task/t2/complete").mock(
+        return_value=httpx.Response(404, text="not found")
+    )
+    result = await TickTickSDK.bulk_complete_tasks([
+        {"project_id": "p1", "task_id": "t1"},
+        {"project_id": "p1", "task_id": "t2"},
+    ])
+    assert result["success"] is False
+    assert result["completed"] == [{"project_id": "p1", "task_id": "t1"}]
+    assert [f["task_id"] for f in result["failed"]] == ["t2"]
+
+
+@respx.mock
+async def test_facade_bulk_complete_tasks_records_transport_errors_as_failed(authenticated_user):
+    respx.post("https://api.ticktick.com/open/v1/project/p1/task/t1/complete").mock(
+        return_value=httpx.Response(200)
+    )
+    respx.post("https://api.ticktick.com/open/v1/project/p1/task/t2/complete").mock(
+        side_effect=httpx.ConnectError("connection reset")
+    )
+    result = await TickTickSDK.bulk_complete_tasks([
+        {"project_id": "p1", "task_id": "t1"},
+        {"project_id": "p1", "task_id": "t2"},
+    ])
+    assert result["completed"] == [{"project_id": "p1", "task_id": "t1"}]
+    assert result["failed"] == [{"project_id": "p1", "task_id": "t2", "error": "connection reset"}]
+
+
+async def test_facade_bulk_complete_tasks_rejects_items_missing_ids(authenticated_user):
+    with pytest.raises(ValueError, match="task_id"):
+        await TickTickSDK.bulk_complete_tasks([{"project_id": "p1"}])
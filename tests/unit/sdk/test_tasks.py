@@ -4,6 +4,9 @@ Sociable: tests run the actual SDK and httpx code paths. respx
 intercepts only the outbound TickTick HTTPS calls.
 """
 
+import asyncio
+import json
+
 import httpx
 import pytest
 import respx
@@ -143,17 +146,16 @@ async def test_update_task_raises_when_task_not_found():
 
 
 @respx.mock
-async def test_complete_task_sets_status_to_2():
-    respx.get("https://api.ticktick.com/open/v1/project/p1/task/t1").mock(
-        return_value=httpx.Response(200, json={
-            "id": "t1", "projectId": "p1", "title": "X", "status": 0,
-        })
+async def test_complete_task_uses_completion_endpoint_without_fetching():
+    fetch = respx.get("https://api.ticktick.com/open/v1/project/p1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1"})
     )
-    update = respx.post("https://api.ticktick.com/open/v1/task/t1").mock(
-        return_value=httpx.Response(200, json={"id": "t1", "status": 2})
+    complete = respx.post("https://api.ticktick.com/open/v1/project/p1/task/t1/complete").mock(
+        return_value=httpx.Response(200)
     )
     await tasks.complete_task(TickTickClient(token="t"), "p1", "t1")
-    assert b'"status":2' in update.calls[0].request.content
+    assert complete.called
+    assert not fetch.called
 
 
 @respx.mock
@@ -163,3 +165,245 @@ async def test_delete_task_calls_delete_endpoint():
     )
     await tasks.delete_task(TickTickClient(token="t"), "p1", "t1")
     assert route.called
+
+
+@respx.mock
+async def test_update_task_skips_fetch_for_recently_listed_task():
+    respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(200, json={"tasks": [
+            {"id": "t1", "projectId": "p1", "title": "Original", "content": "Keep me"},
+        ]})
+    )
+    fetch = respx.get("https://api.ticktick.com/open/v1/project/p1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1", "projectId": "p1"})
+    )
+    update = respx.post("https://api.ticktick.com/open/v1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1", "title": "New"})
+    )
+    client = TickTickClient(token="t")
+    await tasks.list_tasks(client, "p1")
+    await tasks.update_task(client, "p1", "t1", title="New")
+
+    assert not fetch.called
+    assert b"Keep me" in update.calls[0].request.content
+
+
+@respx.mock
+async def test_local_edits_to_listed_tasks_are_not_sent_by_update_task():
+    respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(200, json={"tasks": [
+            {"id": "t1", "projectId": "p1", "title": "Saved", "tags": ["a"]},
+        ]})
+    )
+    update = respx.post("https://api.ticktick.com/open/v1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1"})
+    )
+    client = TickTickClient(token="t")
+    listed = await tasks.list_tasks(client, "p1")
+    listed["tasks"][0]["title"] = "locally edited, never saved"
+    listed["tasks"][0]["tags"].append("local")
+    await tasks.update_task(client, "p1", "t1", priority=3)
+
+    sent = json.loads(update.calls[0].request.content)
+    assert sent["title"] == "Saved"
+    assert sent["tags"] == ["a"]
+
+
+@respx.mock
+async def test_update_task_refetches_after_previous_update():
+    fetch = respx.get("https://api.ticktick.com/open/v1/project/p1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1", "projectId": "p1", "title": "X"})
+    )
+    respx.post("https://api.ticktick.com/open/v1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1"})
+    )
+    client = TickTickClient(token="t")
+    await tasks.update_task(client, "p1", "t1", title="A")
+    await tasks.update_task(client, "p1", "t1", title="B")
+    assert fetch.call_count == 2
+
+
+@respx.mock
+async def test_task_cache_is_not_shared_between_tokens():
+    respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(200, json={"tasks": [{"id": "t1", "title": "Alice's"}]})
+    )
+    fetch = respx.get("https://api.ticktick.com/open/v1/project/p1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1", "title": "Bob's"})
+    )
+    update = respx.post("https://api.ticktick.com/open/v1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1"})
+    )
+    await tasks.list_tasks(TickTickClient(token="alice"), "p1")
+    await tasks.update_task(TickTickClient(token="bob"), "p1", "t1", priority=1)
+    assert fetch.called
+    assert b"Alice's" not in update.calls[0].request.content
+
+
+@respx.mock
+async def test_bulk_complete_tasks_completes_each_and_reports_failures_in_order():
+    complete = respx.post(url__regex=r"https://api.ticktick.com/open/v1/project/p1/task/t\d/complete").mock(
+        return_value=httpx.Response(200)
+    )
+    respx.post("https://api.ticktick.com/open/v1/project/p1/task/gone/complete").mock(
+        return_value=httpx.Response(404, text="not found")
+    )
+    results = await tasks.bulk_complete_tasks(
+        TickTickClient(token="t"), [("p1", "t1"), ("p1", "gone"), ("p1", "t2")],
+    )
+    assert results[0] is None
+    assert isinstance(results[1], APIError)
+    assert results[2] is None
+    assert complete.call_count == 2
+
+
+@respx.mock
+async def test_task_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(tasks, "TASK_CACHE_MAX", 2)
+    respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(200, json={"tasks": [{"id": "a"}, {"id": "b"}]})
+    )
+    respx.get("https://api.ticktick.com/open/v1/project/p2/data").mock(
+        return_value=httpx.Response(200, json={"tasks": [{"id": "c"}]})
+    )
+    fetch_a = respx.get("https://api.ticktick.com/open/v1/project/p1/task/a").mock(
+        return_value=httpx.Response(200, json={"id": "a"})
+    )
+    fetch_b = respx.get("https://api.ticktick.com/open/v1/project/p1/task/b").mock(
+        return_value=httpx.Response(200, json={"id": "b"})
+    )
+    respx.post(url__regex=r"https://api.ticktick.com/open/v1/task/[ab]").mock(
+        return_value=httpx.Response(200, json={})
+    )
+    client = TickTickClient(token="t")
+    await tasks.list_tasks(client, "p1")
+    await tasks.get_task(client, "p1", "a")  # a is now the most recently used
+    await tasks.list_tasks(client, "p2")  # a third task pushes one out
+
+    await tasks.update_task(client, "p1", "a", priority=1)
+    await tasks.update_task(client, "p1", "b", priority=1)
+    assert fetch_a.call_count == 1  # only the explicit get_task
+    assert fetch_b.call_count == 1  # b was evicted, so update_task refetched it
+
+
+@respx.mock
+async def test_concurrent_get_task_calls_share_one_project_fetch():
+    data = respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(200, json={"tasks": [
+            {"id": "t1", "title": "one"},
+            {"id": "t2", "title": "two"},
+        ]})
+    )
+    single = respx.get("https://api.ticktick.com/open/v1/project/p1/task/t3").mock(
+        return_value=httpx.Response(200, json={"id": "t3", "title": "done", "status": 2})
+    )
+    client = TickTickClient(token="t")
+    results = await asyncio.gather(
+        tasks.get_task(client, "p1", "t1"),
+        tasks.get_task(client, "p1", "t2"),
+        tasks.get_task(client, "p1", "t3"),
+    )
+    assert [r["title"] for r in results] == ["one", "two", "done"]
+    assert data.call_count == 1
+    assert single.call_count == 1
+
+
+@respx.mock
+async def test_concurrent_get_task_calls_for_one_id_get_separate_objects():
+    respx.get("https://api.ticktick.com/open/v1/project/p1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1", "title": "Saved", "tags": ["a"]})
+    )
+    client = TickTickClient(token="t")
+    first, second = await asyncio.gather(
+        tasks.get_task(client, "p1", "t1"),
+        tasks.get_task(client, "p1", "t1"),
+    )
+    first["tags"].append("local")
+    assert second == {"id": "t1", "title": "Saved", "tags": ["a"]}
+
+
+@respx.mock
+async def test_concurrent_get_task_calls_all_see_api_errors():
+    respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(500, text="down")
+    )
+    client = TickTickClient(token="t")
+    results = await asyncio.gather(
+        tasks.get_task(client, "p1", "t1"),
+        tasks.get_task(client, "p1", "t2"),
+        tasks.get_task(client, "p1", "t3"),
+        return_exceptions=True,
+    )
+    assert len(results) == 3
+    assert all(isinstance(r, APIError) for r in results)
+
+
+@respx.mock
+async def test_concurrent_get_task_failure_for_one_task_does_not_affect_others():
+    respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(200, json={"tasks": [
+            {"id": "t1", "title": "one"},
+            {"id": "t3", "title": "three"},
+        ]})
+    )
+    respx.get("https://api.ticktick.com/open/v1/project/p1/task/t2").mock(
+        return_value=httpx.Response(500, text="down")
+    )
+    client = TickTickClient(token="t")
+    first, second, third = await asyncio.gather(
+        tasks.get_task(client, "p1", "t1"),
+        tasks.get_task(client, "p1", "t2"),
+        tasks.get_task(client, "p1", "t3"),
+        return_exceptions=True,
+    )
+    assert first["title"] == "one"
+    assert isinstance(second, APIError)
+    assert third["title"] == "three"
+
+
+@respx.mock
+async def test_few_concurrent_get_task_calls_skip_the_project_fetch():
+    data = respx.get("https://api.ticktick.com/open/v1/project/p1/data")
+    respx.get("https://api.ticktick.com/open/v1/project/p1/task/t1").mock(
+        return_value=httpx.Response(200, json={"id": "t1", "status": 2})
+    )
+    respx.get("https://api.ticktick.com/open/v1/project/p1/task/t2").mock(
+        return_value=httpx.Response(200, json={"id": "t2", "status": 2})
+    )
+    client = TickTickClient(token="t")
+    results = await asyncio.gather(
+        tasks.get_task(client, "p1", "t1"),
+        tasks.get_task(client, "p1", "t2"),
+    )
+    assert [r["id"] for r in results] == ["t1", "t2"]
+    assert respx.calls.call_count == 2
+    assert not data.called
+
+
+@respx.mock
+async def test_get_task_calls_for_known_completed_tasks_skip_the_project_fetch():
+    data = respx.get("https://api.ticktick.com/open/v1/project/p1/data")
+    for task_id in ("t1", "t2", "t3"):
+        respx.get(f"https://api.ticktick.com/open/v1/project/p1/task/{task_id}").mock(
+            return_value=httpx.Response(200, json={"id": task_id, "status": 2})
+        )
+    client = TickTickClient(token="t")
+    await tasks.get_task(client, "p1", "t1")
+    await tasks.get_task(client, "p1", "t2")
+    await asyncio.gather(*(tasks.get_task(client, "p1", t) for t in ("t1", "t2", "t3")))
+    assert respx.calls.call_count == 5
+    assert not data.called
+
+
+@respx.mock
+async def test_list_tasks_batch_returns_results_keyed_by_project():
+    respx.get("https://api.ticktick.com/open/v1/project/p1/data").mock(
+        return_value=httpx.Response(200, json={"tasks": [{"id": "t1", "status": 0}]})
+    )
+    respx.get("https://api.ticktick.com/open/v1/project/p2/data").mock(
+        return_value=httpx.Response(200, json={"tasks": []})
+    )
+    result = await tasks.list_tasks_batch(TickTickClient(token="t"), ["p1", "p2"])
+    assert set(result) == {"p1", "p2"}
+    assert result["p1"]["incomplete"] == 1
+    assert result["p2"]["count"] == 0
@@ -0,0 +1,97 @@
+"""Tests for the OAuth helper behind ``ticktick auth login``.
+
+The local callback server runs for real on a free port; a fake
+browser hits it over HTTP. Only the TickTick token endpoint is
+mocked (respx).
+"""
+
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from ticktick import auth
+
+
+@pytest.fixture
+def free_port(monkeypatch):
+    with socket.socket() as s:
+        s.bind(("", 0))
+        port = s.getsockname()[1]
+    monkeypatch.setattr(auth, "PORT", port)
+    return port
+
+
+def _browser_redirecting_to(port, query, sent):
+    """Stand-in for webbrowser.open that follows the OAuth redirect."""
+
+    def open_(url):
+        def hit():
+            sent.append(time.monotonic())
+            try:
+                urllib.request.urlopen(f"http://localhost:{port}/{query}").read()
+            except urllib.error.HTTPError:
+                pass  # the 400 page for a redirect without a code
+
+        threading.Thread(target=hit, daemon=True).start()
+
+    return open_
+
+
+@respx.mock
+def test_run_oauth_flow_returns_token_promptly_after_callback(free_port):
+    route = respx.post(auth.TOKEN_URL).mock(return_value=httpx.Response(200, json={"access_token": "fresh-token"}))
+    sent = []
+    with patch("webbrowser.open", _browser_redirecting_to(free_port, "?code=abc", sent)):
+        token = auth.run_oauth_flow("cid", "secret")
+    returned = time.monotonic()
+
+    assert token == "fresh-token"
+    assert b"code=abc" in route.calls[0].request.content
+    assert returned - sent[0] < 0.2
+
+
+def test_run_oauth_flow_raises_when_redirect_has_no_code(free_port):
+    sent = []
+    with patch("webbrowser.open", _browser_redirecting_to(free_port, "?error=denied", sent)):
+        with pytest.raises(RuntimeError):
+            auth.run_oauth_flow("cid", "secret")
+
+
+@respx.mock
+def test_run_oauth_flow_serves_redirect_behind_an_idle_connection(free_port):
+    respx.post(auth.TOKEN_URL).mock(return_value=httpx.Response(200, json={"access_token": "fresh-token"}))
+    browser = _browser_redirecting_to(free_port, "?code=abc", [])
+
+    def preconnect_then_redirect(url):
+        # Browsers open speculative connections that never send a request.
+        idle.append(socket.create_connection(("localhost", free_port)))
+        browser(url)
+
+    idle = []
+    try:
+        with patch("webbrowser.open", preconnect_then_redirect):
+            assert auth.run_oauth_flow("cid", "secret") == "fresh-token"
+    finally:
+        for conn in idle:
+            conn.close()
+
+
+def test_run_oauth_flow_times_out_despite_an_idle_connection(free_port, monkeypatch):
+    monkeypatch.setattr(auth, "CALLBACK_TIMEOUT", 0.2)
+    idle = []
+    try:
+        with patch("webbrowser.open", lambda url: idle.append(socket.create_connection(("localhost", free_port)))):
+            started = time.monotonic()
+            with pytest.raises(RuntimeError):
+                auth.run_oauth_flow("cid", "secret")
+        assert time.monotonic() - started < 1.5
+    finally:
+        for conn in idle:
+            conn.close()
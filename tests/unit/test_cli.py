@@ -29,7 +29,7 @@ def test_auth_login_requires_client_id_and_secret():
 
 
 def test_auth_login_prints_token_on_success():
-    with patch("ticktick.cli.run_oauth_flow", return_value="freshly-minted-token"):
+    with patch("ticktick.auth.run_oauth_flow", return_value="freshly-minted-token"):
         result = CliRunner().invoke(
             cli, [
                 "auth", "login",
@@ -42,7 +42,7 @@ def test_auth_login_prints_token_on_success():
 
 
 def test_auth_login_reports_error_on_failure():
-    with patch("ticktick.cli.run_oauth_flow", side_effect=RuntimeError("boom")):
+    with patch("ticktick.auth.run_oauth_flow", side_effect=RuntimeError("boom")):
         result = CliRunner().invoke(
             cli, [
                 "auth", "login",
@@ -56,7 +56,7 @@ def test_auth_login_reports_error_on_failure():
 
 def test_auth_login_reads_credentials_from_env():
     """Operators can avoid putting secrets on the command line."""
-    with patch("ticktick.cli.run_oauth_flow", return_value="env-token") as mock_flow:
+    with patch("ticktick.auth.run_oauth_flow", return_value="env-token") as mock_flow:
         result = CliRunner().invoke(
             cli, ["auth", "login"],
             env={"TICKTICK_CLIENT_ID": "envcid", "TICKTICK_CLIENT_SECRET": "envsec"},
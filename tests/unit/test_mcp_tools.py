@@ -86,18 +86,15 @@ async def test_delete_task_round_trip(authenticated_user):
 
 
 @respx.mock
-async def test_complete_task_marks_status_2(authenticated_user):
-    respx.get("https://api.ticktick.com/open/v1/project/p1/task/t1").mock(
-        return_value=httpx.Response(200, json={
-            "id": "t1", "projectId": "p1", "title": "X", "status": 0,
-        })
-    )
-    update = respx.post("https://api.ticktick.com/open/v1/task/t1").mock(
-        return_value=httpx.Response(200, json={"id": "t1", "status": 2})
+async def test_complete_task_calls_completion_endpoint(authenticated_user):
+    complete = respx.post("https://api.ticktick.com/open/v1/project/p1/task/t1/complete").mock(
+        return_value=httpx.Response(200)
     )
     result = await tools.complete_task("p1", "t1")
     assert result["success"] is True
-    assert b'"status":2' in update.calls[0].request.content
+    assert result["message"] == "Task t1 marked completed"
+    assert result["task"] is None
+    assert complete.called
 
 
 @respx.mock
@@ -113,3 +110,32 @@ async def test_update_task_round_trip(authenticated_user):
     result = await tools.update_task(project_id="p1", task_id="t1", title="New")
     assert result["success"] is True
     assert result["task"]["title"] == "New"
+
+
+@respx.mock
+async def test_bulk_complete_tasks_round_trip(authenticated_user):
+    complete = respx.post("https://api.ticktick.com/open/v1/project/p1/task/t1/complete").mock(
+        return_value=httpx.Response(200)
+    )
+    result = await tools.bulk_complete_tasks([{"project_id": "p1", "task_id": "t1"}])
+    assert result["success"] is True
+    assert result["completed"] == [{"project_id": "p1", "task_id": "t1"}]
+    assert result["failed"] == []
+    assert complete.called
+
+
+@respx.mock
+async def test_bulk_complete_tasks_returns_error_envelope_on_auth_failure(authenticated_user):
+    respx.post("https://api.ticktick.com/open/v1/project/p1/task/t1/complete").mock(
+        return_value=httpx.Response(401, json={"error": "unauthorized"})
+    )
+    result = await tools.bulk_complete_tasks([{"project_id": "p1", "task_id": "t1"}])
+    assert result["success"] is False
+    assert "error" in result
+
+
+async def test_bulk_complete_tasks_returns_error_envelope_for_malformed_items(authenticated_user):
+    result = await tools.bulk_complete_tasks([{"task_id": "t1"}])
+    assert result["success"] is False
+    assert "project_id" in result["error"]
+    assert result["completed"] == [] and result["failed"] == []
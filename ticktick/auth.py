@@ -8,10 +8,12 @@ mcp-app user store, not in any local config file.
 
 from __future__ import annotations
 
+import functools
 import http.server
-import socketserver
+import socket
+import threading
 import webbrowser
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import httpx
 
@@ -21,74 +23,134 @@ REDIRECT_URI = "http://localhost:8080"
 SCOPE = "tasks:read tasks:write"
 STATE = "ticktick-access-oauth"
 PORT = 8080
+CALLBACK_TIMEOUT = 300  # seconds to wait for the browser redirect
+TOKEN_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Query parameters that are the same for every authorization request.
+_STATIC_AUTH_PARAMS = (
+    ("scope", SCOPE),
+    ("redirect_uri", REDIRECT_URI),
+    ("state", STATE),
+    ("response_type", "code"),
+)
+
+_SUCCESS_HTML = (
+    b"<html><body style='font-family:sans-serif;text-align:center;'>"
+    b"<h1>Authentication Successful</h1>"
+    b"<p>Return to the terminal - your access token is being printed there.</p>"
+    b"</body></html>"
+)
+_FAILURE_HTML = b"<h1>Authentication Failed</h1>"
+
+
+class _CallbackServer(http.server.ThreadingHTTPServer):
+    """Local redirect target; signals ``done`` once the callback arrives.
+
+    Each connection gets its own handler thread, so an idle socket (e.g.
+    a browser preconnect) can't hold up the redirect queued behind it.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+    timeout = 0.05  # how often the accept loop checks ``done``
+
+    def __init__(self, address, handler):
+        super().__init__(address, handler)
+        self.authorization_code: str | None = None
+        self.done = threading.Event()
 
 
 class _CallbackHandler(http.server.SimpleHTTPRequestHandler):
     """Captures the authorization code from the OAuth redirect."""
 
-    authorization_code: str | None = None
-    server_should_stop: bool = False
+    server: _CallbackServer
+    timeout = 10  # drop connections that never send a request line
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     def do_GET(self):  # noqa: N802 — http.server API
-        params = parse_qs(urlparse(self.path).query)
-        if "code" in params:
-            _CallbackHandler.authorization_code = params["code"][0]
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html")
+        url = urlparse(self.path)
+        if url.path != "/":
+            # Browsers probe for /favicon.ico etc.; not the redirect.
+            self.send_response(404)
             self.end_headers()
-            self.wfile.write(
-                b"<html><body style='font-family:sans-serif;text-align:center;'>"
-                b"<h1>Authentication Successful</h1>"
-                b"<p>Return to the terminal - your access token is being printed there.</p>"
-                b"</body></html>"
-            )
+            return
+
+        params = parse_qs(url.query)
+        if "code" in params:
+            self.server.authorization_code = params["code"][0]
+            self._send_html(200, _SUCCESS_HTML)
         else:
-            self.send_response(400)
-            self.send_header("Content-Type", "text/html")
-            self.end_headers()
-            self.wfile.write(b"<h1>Authentication Failed</h1>")
-        _CallbackHandler.server_should_stop = True
+            self._send_html(400, _FAILURE_HTML)
+        self.wfile.flush()
+        self.server.done.set()
+
+    def _send_html(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
     def log_message(self, format, *args):  # noqa: A002 — http.server API
         return
 
 
+@functools.cache
+def _token_http() -> httpx.Client:
+    """Process-wide client for the token endpoint (keeps the TLS connection warm)."""
+    return httpx.Client(
+        transport=httpx.HTTPTransport(retries=2),
+        timeout=TOKEN_TIMEOUT,
+    )
+
+
+def _serve_until_done(httpd: _CallbackServer) -> None:
+    while not httpd.done.is_set():
+        httpd.handle_request()
+
+
 def run_oauth_flow(client_id: str, client_secret: str) -> str:
     """Open the browser for OAuth authorization and return the access token.
 
     Raises:
-        RuntimeError: If the user cancels or no code is returned.
+        RuntimeError: If the user cancels, no code is returned, or the
+            redirect doesn't arrive within ``CALLBACK_TIMEOUT`` seconds.
         httpx.HTTPError: If the token-exchange request fails.
     """
-    _CallbackHandler.authorization_code = None
-    _CallbackHandler.server_should_stop = False
-
-    with socketserver.TCPServer(("", PORT), _CallbackHandler) as httpd:
-        url = (
-            f"{AUTH_URL}?client_id={client_id}&scope={SCOPE}"
-            f"&redirect_uri={REDIRECT_URI}&state={STATE}&response_type=code"
-        )
+    with _CallbackServer(("", PORT), _CallbackHandler) as httpd:
+        query = urlencode((("client_id", client_id), *_STATIC_AUTH_PARAMS))
+        url = f"{AUTH_URL}?{query}"
         print(f"Opening browser for TickTick authorization on port {PORT}.")
         print(f"If your browser doesn't open, visit: {url}")
-        webbrowser.open(url)
-
-        while not _CallbackHandler.server_should_stop:
-            httpd.handle_request()
 
-    if not _CallbackHandler.authorization_code:
+        server_thread = threading.Thread(target=_serve_until_done, args=(httpd,), daemon=True)
+        server_thread.start()
+        try:
+            webbrowser.open(url)
+            httpd.done.wait(timeout=CALLBACK_TIMEOUT)
+        finally:
+            # Stops the accept loop within one handle_request() timeout;
+            # handler threads are daemons and never block teardown.
+            httpd.done.set()
+            server_thread.join(timeout=1)
+        authorization_code = httpd.authorization_code
+
+    if not authorization_code:
         raise RuntimeError("Authorization cancelled or no code returned.")
 
-    response = httpx.post(
+    response = _token_http().post(
         TOKEN_URL,
         data={
             "client_id": client_id,
             "client_secret": client_secret,
-            "code": _CallbackHandler.authorization_code,
+            "code": authorization_code,
             "grant_type": "authorization_code",
             "redirect_uri": REDIRECT_URI,
             "scope": SCOPE,
         },
-        timeout=30,
     )
     response.raise_for_status()
     body = response.json()
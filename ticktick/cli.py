@@ -20,7 +20,6 @@ import sys
 import click
 
 from ticktick import __version__
-from ticktick.auth import run_oauth_flow
 
 
 @click.group()
@@ -61,6 +60,9 @@ def auth_login(client_id, client_secret):
     \b
         ticktick-admin users add you@example.com --access-token <token>
     """
+    # Deferred: pulls in http.server and webbrowser, which only login needs.
+    from ticktick.auth import run_oauth_flow
+
     try:
         token = run_oauth_flow(client_id, client_secret)
     except Exception as e:  # noqa: BLE001 — surface error to user
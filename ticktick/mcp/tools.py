@@ -157,6 +157,9 @@ async def update_task(
 async def complete_task(project_id: str, task_id: str) -> dict[str, Any]:
     """Mark a task as completed.
 
+    The completion endpoint returns no body, so ``task`` in the result
+    is always null.
+
     Args:
         project_id: The project ID containing the task.
         task_id: The task ID to complete.
@@ -170,6 +173,27 @@ async def complete_task(project_id: str, task_id: str) -> dict[str, Any]:
         return {"success": False, "error": str(e), "task": None}
 
 
+async def bulk_complete_tasks(items: list[dict[str, str]]) -> dict[str, Any]:
+    """Mark several tasks as completed in one call.
+
+    The tasks are completed concurrently. A failure on one task doesn't
+    stop the others — check ``failed`` in the result.
+
+    Args:
+        items: Tasks to complete, each as
+            ``{"project_id": "...", "task_id": "..."}``.
+    """
+    try:
+        return await sdk.bulk_complete_tasks(items)
+    except ValueError as e:
+        return {"success": False, "error": str(e), "completed": [], "failed": []}
+    except AuthenticationError as e:
+        return {"success": False, "error": str(e), "completed": [], "failed": []}
+    except APIError as e:
+        logger.error(f"bulk_complete_tasks: {e}")
+        return {"success": False, "error": str(e), "completed": [], "failed": []}
+
+
 async def delete_task(project_id: str, task_id: str) -> dict[str, Any]:
     """Permanently delete a task in a TickTick project.
 
@@ -8,7 +8,13 @@ and delegates to the SDK modules.
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import http.cookiejar
 import logging
+import re
+import time
+import weakref
 from importlib.metadata import version
 from typing import Any
 
@@ -19,6 +25,54 @@ logger = logging.getLogger(__name__)
 TICKTICK_API_BASE = "https://api.ticktick.com/open/v1"
 USER_AGENT = f"ticktick-access/{version('ticktick-access')}"
 
+# One pooled AsyncClient per event loop, shared by every TickTickClient so
+# keep-alive connections and TLS sessions survive across API calls. The
+# bearer token is sent per request and the cookie jar refuses every
+# cookie, so no per-user state lives on the shared client.
+_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the running loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        # A client's pooled connections belong to the loop that opened
+        # them, so each loop gets its own. Clients of loops that have
+        # been closed are dropped; a live loop's client is never touched
+        # from here, since it may have requests in flight.
+        for stale in [other for other in _http_clients if other.is_closed()]:
+            del _http_clients[stale]
+        client = _http_clients[loop] = httpx.AsyncClient(
+            base_url=TICKTICK_API_BASE,
+            headers={"User-Agent": USER_AGENT},
+            cookies=_no_cookies(),
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+    return client
+
+
+def _no_cookies() -> http.cookiejar.CookieJar:
+    """A cookie jar that never stores anything, so sessions can't cross users."""
+    return http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+
+# Bodies of GET responses that carried an ETag, so repeat reads can ask
+# TickTick for a 304 instead of the full payload. Keyed by token so
+# users never share entries; LRU-bounded with a TTL to cap memory.
+# Only the project list and single tasks are cached: full project/<id>/data
+# payloads are too large to hold on to.
+ETAG_CACHE_TTL = 300.0  # seconds
+ETAG_CACHE_MAX = 256
+_ETAG_CACHEABLE = re.compile(r"project(/[^/]+/task/[^/]+)?")
+_etag_cache: dict[tuple, tuple[float, str, Any]] = {}
+
+
+def clear_response_cache() -> None:
+    """Forget every cached ETag and response body."""
+    _etag_cache.clear()
+
 
 class TickTickError(Exception):
     """Base exception for TickTick API errors."""
@@ -43,6 +97,15 @@ class TickTickClient:
                 "  ticktick-admin users update-profile <email> access_token <token>"
             )
         self._token = token
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+
+    @property
+    def token(self) -> str:
+        """The bearer token this client authenticates with."""
+        return self._token
 
     async def request(
         self,
@@ -56,18 +119,25 @@ class TickTickClient:
         Raises :class:`AuthenticationError` on 401, :class:`APIError`
         on other non-success statuses.
         """
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": "application/json",
-        }
-        url = f"{TICKTICK_API_BASE}/{endpoint}"
-
-        async with httpx.AsyncClient() as http:
-            response = await http.request(
-                method, url, headers=headers, json=data, params=params, timeout=30.0,
-            )
-
+        headers = self._headers
+        cache_key = None
+        cached = None
+        if method == "GET" and _ETAG_CACHEABLE.fullmatch(endpoint):
+            cache_key = (self._token, endpoint, tuple(sorted((params or {}).items())))
+            cached = _etag_cache.pop(cache_key, None)
+            if cached is not None and cached[0] < time.monotonic():
+                cached = None
+            if cached is not None:
+                headers = {**headers, "If-None-Match": cached[1]}
+
+        response = await _http_client().request(
+            method, endpoint, headers=headers, json=data, params=params,
+        )
+
+        if response.status_code == 304 and cached is not None:
+            _etag_cache[cache_key] = (time.monotonic() + ETAG_CACHE_TTL, cached[1], cached[2])
+            # Callers may mutate what they get back; never hand out the cached object.
+            return copy.deepcopy(cached[2])
         if response.status_code == 401:
             raise AuthenticationError("TickTick rejected the access token (401)")
         if response.status_code >= 400:
@@ -77,7 +147,13 @@ class TickTickClient:
             )
         if response.status_code == 204 or not response.content:
             return None
-        return response.json()
+        body = response.json()
+        etag = response.headers.get("ETag")
+        if cache_key is not None and etag:
+            _etag_cache[cache_key] = (time.monotonic() + ETAG_CACHE_TTL, etag, copy.deepcopy(body))
+            while len(_etag_cache) > ETAG_CACHE_MAX:
+                del _etag_cache[next(iter(_etag_cache))]
+        return body
 
     async def get(self, endpoint: str, params: dict[str, Any] | None = None):
         return await self.request("GET", endpoint, params=params)
@@ -151,11 +227,42 @@ class TickTickSDK:
         from ticktick.sdk import tasks
 
         result = await tasks.complete_task(cls._client(), project_id, task_id)
-        title = (result or {}).get("title", task_id)
         return {
             "success": True,
             "task": result,
-            "message": f"Task '{title}' marked completed",
+            "message": f"Task {task_id} marked completed",
+        }
+
+    @classmethod
+    async def bulk_complete_tasks(cls, items: list[dict[str, str]]) -> dict[str, Any]:
+        from ticktick.sdk import tasks
+
+        pairs = []
+        for item in items:
+            project_id = item.get("project_id") if isinstance(item, dict) else None
+            task_id = item.get("task_id") if isinstance(item, dict) else None
+            if not (isinstance(project_id, str) and project_id and isinstance(task_id, str) and task_id):
+                raise ValueError(f"Each item needs a project_id and a task_id, got {item!r}")
+            pairs.append((project_id, task_id))
+        results = await tasks.bulk_complete_tasks(cls._client(), pairs)
+        completed: list[dict[str, str]] = []
+        failed: list[dict[str, str]] = []
+        for (project_id, task_id), result in zip(pairs, results, strict=True):
+            if isinstance(result, AuthenticationError):
+                raise result
+            if isinstance(result, Exception):
+                # One task's API or transport failure doesn't sink the batch.
+                error = str(result) or repr(result)
+                failed.append({"project_id": project_id, "task_id": task_id, "error": error})
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                completed.append({"project_id": project_id, "task_id": task_id})
+        return {
+            "success": not failed,
+            "completed": completed,
+            "failed": failed,
+            "message": f"Completed {len(completed)} of {len(pairs)} tasks",
         }
 
     @classmethod
@@ -7,13 +7,16 @@ constructs the client from the current user's profile.
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import time
 from typing import Any
 
 from ticktick.sdk.client import APIError, TickTickClient
 
 
 # Fields that round-trip through the TickTick task PUT endpoint.
-TASK_FIELDS = {
+TASK_FIELDS = frozenset({
     "id",
     "projectId",
     "title",
@@ -44,29 +47,198 @@ TASK_FIELDS = {
     "reminderCount",
     "commentCount",
     "attachments",
-}
+})
+
+# TickTick's update endpoint needs the full task, so update_task merges
+# into the current copy. Tasks seen by list_tasks/get_task are kept for a
+# short time so an update right after a read skips the extra GET. The
+# least recently used entry is evicted past TASK_CACHE_MAX. Keyed by
+# token as well so users never see each other's entries.
+TASK_CACHE_TTL = 30.0  # seconds
+TASK_CACHE_MAX = 512
+_task_cache: dict[tuple[str, str, str], tuple[float, dict[str, Any]]] = {}
+
+# Upper bound on concurrent TickTick requests from one bulk operation.
+BULK_CONCURRENCY = 10
+
+
+def _remember_task(client: TickTickClient, project_id: str, task: dict[str, Any]) -> None:
+    key = (client.token, project_id, task.get("id"))
+    _task_cache.pop(key, None)
+    # Store a private copy: callers get the original and may edit it
+    # locally, which must not leak into what update_task sends.
+    _task_cache[key] = (time.monotonic() + TASK_CACHE_TTL, copy.deepcopy(task))
+    while len(_task_cache) > TASK_CACHE_MAX:
+        del _task_cache[next(iter(_task_cache))]
+
+
+def _recent_task(client: TickTickClient, project_id: str, task_id: str) -> dict[str, Any] | None:
+    key = (client.token, project_id, task_id)
+    entry = _task_cache.get(key)
+    if entry is None:
+        return None
+    expires, task = entry
+    del _task_cache[key]
+    if expires < time.monotonic():
+        return None
+    _task_cache[key] = entry  # re-insert as most recently used
+    return task
+
+
+def _forget_task(client: TickTickClient, project_id: str, task_id: str) -> None:
+    _task_cache.pop((client.token, project_id, task_id), None)
+
+
+def clear_task_cache() -> None:
+    """Drop every cached task (e.g. after edits made outside this process)."""
+    _task_cache.clear()
 
 
 async def list_tasks(client: TickTickClient, project_id: str) -> dict[str, Any]:
     """Return all tasks in a project plus a small status summary."""
     data = await client.get(f"project/{project_id}/data")
-    tasks = (data or {}).get("tasks", []) if isinstance(data, dict) else []
+    tasks = (data.get("tasks") if isinstance(data, dict) else None) or []
+    if not tasks:
+        return {"project_id": project_id, "tasks": tasks, "count": 0, "completed": 0, "incomplete": 0}
+
+    completed = incomplete = 0
+    for t in tasks:
+        _remember_task(client, project_id, t)
+        status = t.get("status")
+        if status == 2:
+            completed += 1
+        elif status == 0:
+            incomplete += 1
     return {
         "project_id": project_id,
         "tasks": tasks,
         "count": len(tasks),
-        "completed": sum(1 for t in tasks if t.get("status") == 2),
-        "incomplete": sum(1 for t in tasks if t.get("status") == 0),
+        "completed": completed,
+        "incomplete": incomplete,
     }
 
 
+async def list_tasks_batch(
+    client: TickTickClient, project_ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    """Return :func:`list_tasks` results for several projects, keyed by project ID.
+
+    Projects are fetched concurrently, at most ``BULK_CONCURRENCY`` at a
+    time. Raises the first error encountered.
+    """
+    limit = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def _list(project_id: str) -> dict[str, Any]:
+        async with limit:
+            return await list_tasks(client, project_id)
+
+    results = await asyncio.gather(*(_list(project_id) for project_id in project_ids))
+    return {result["project_id"]: result for result in results}
+
+
+# get_task calls for one project that arrive in the same event-loop pass
+# (e.g. from one gather) are queued together. Once at least
+# GET_TASK_BATCH_MIN of them could be served by one project-data fetch,
+# that replaces the per-task requests; smaller groups stay individual.
+GET_TASK_BATCH_WINDOW = 0.0  # seconds; 0 only yields once, so lone calls don't wait
+GET_TASK_BATCH_MIN = 3
+_pending_gets: dict[tuple[str, str], list[tuple[str, asyncio.Future]]] = {}
+_flushes: set[asyncio.Task] = set()
+
+
 async def get_task(
     client: TickTickClient, project_id: str, task_id: str,
 ) -> dict[str, Any] | None:
-    """Return a single task by ID, or None if not found."""
+    """Return a single task by ID, or None if not found.
+
+    Concurrent lookups in the same project are coalesced — see
+    ``GET_TASK_BATCH_MIN``.
+    """
+    loop = asyncio.get_running_loop()
+    key = (client.token, project_id)
+    waiter: asyncio.Future[dict[str, Any] | None] = loop.create_future()
+    pending = _pending_gets.get(key)
+    if pending is None:
+        pending = _pending_gets[key] = []
+        flush = loop.create_task(_flush_gets(client, key))
+        _flushes.add(flush)
+        flush.add_done_callback(_flushes.discard)
+    pending.append((task_id, waiter))
+
+    task = await waiter
+    if isinstance(task, dict):
+        _remember_task(client, project_id, task)
+    return task
+
+
+def _known_completed(client: TickTickClient, project_id: str, task_id: str) -> bool:
+    entry = _task_cache.get((client.token, project_id, task_id))
+    return entry is not None and entry[1].get("status") == 2
+
+
+async def _fetch_task(client: TickTickClient, project_id: str, task_id: str) -> Any:
     return await client.get(f"project/{project_id}/task/{task_id}")
 
 
+async def _fetch_tasks(
+    client: TickTickClient, project_id: str, task_ids: list[str],
+) -> dict[str, Any]:
+    """Map each task ID to its task (or None, or the error raised for it)."""
+    # Project data omits completed tasks, so ones already known to be
+    # completed can't count towards making the bulk fetch worthwhile.
+    coverable = [task_id for task_id in task_ids if not _known_completed(client, project_id, task_id)]
+    if len(coverable) < GET_TASK_BATCH_MIN:
+        results = await asyncio.gather(
+            *(_fetch_task(client, project_id, task_id) for task_id in task_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(task_ids, results, strict=True))
+
+    data = await client.get(f"project/{project_id}/data")
+    tasks = (data or {}).get("tasks", []) if isinstance(data, dict) else []
+    wanted = set(task_ids)
+    found: dict[str, Any] = {t["id"]: t for t in tasks if t.get("id") in wanted}
+    # Anything project data didn't include is looked up individually.
+    missing = [task_id for task_id in task_ids if task_id not in found]
+    results = await asyncio.gather(
+        *(_fetch_task(client, project_id, task_id) for task_id in missing),
+        return_exceptions=True,
+    )
+    found.update(zip(missing, results, strict=True))
+    return found
+
+
+async def _flush_gets(client: TickTickClient, key: tuple[str, str]) -> None:
+    waiters: list[tuple[str, asyncio.Future]] | None = None
+    try:
+        await asyncio.sleep(GET_TASK_BATCH_WINDOW)
+        waiters = _pending_gets.pop(key)
+        task_ids = list(dict.fromkeys(task_id for task_id, _ in waiters))
+        try:
+            found = await _fetch_tasks(client, key[1], task_ids)
+        except Exception as e:  # noqa: BLE001 — handed to every waiter
+            found = dict.fromkeys(task_ids, e)
+    except BaseException:
+        # Cancelled (e.g. loop shutdown): don't leave callers waiting.
+        for _, waiter in waiters or _pending_gets.pop(key, []):
+            waiter.cancel()
+        raise
+
+    handed_out: set[str] = set()
+    for task_id, waiter in waiters:
+        if waiter.done():
+            continue
+        result = found.get(task_id)
+        if isinstance(result, BaseException):
+            waiter.set_exception(result)
+        elif task_id in handed_out:
+            # Callers asking for the same ID each get their own object.
+            waiter.set_result(copy.deepcopy(result))
+        else:
+            handed_out.add(task_id)
+            waiter.set_result(result)
+
+
 async def create_task(
     client: TickTickClient,
     project_id: str,
@@ -111,12 +283,18 @@ async def update_task(
     reminders: list[str] | None = None,
     completed_time: str | None = None,
 ) -> dict[str, Any]:
-    """Update an existing task. Preserves untouched fields."""
-    existing = await get_task(client, project_id, task_id)
+    """Update an existing task. Preserves untouched fields.
+
+    Merges into a copy of the task read within the last
+    ``TASK_CACHE_TTL`` seconds when there is one, otherwise fetches it.
+    """
+    existing = _recent_task(client, project_id, task_id) or await get_task(
+        client, project_id, task_id,
+    )
     if not existing:
         raise APIError(f"Task not found: {task_id} in project {project_id}")
 
-    payload = {k: v for k, v in existing.items() if k in TASK_FIELDS}
+    payload = {k: existing[k] for k in existing.keys() & TASK_FIELDS}
     payload["projectId"] = project_id
 
     if title is not None:
@@ -136,16 +314,47 @@ async def update_task(
     if completed_time is not None:
         payload["completedTime"] = completed_time
 
-    return await client.post(f"task/{task_id}", payload)
+    result = await client.post(f"task/{task_id}", payload)
+    _forget_task(client, project_id, task_id)
+    return result
 
 
 async def complete_task(
     client: TickTickClient, project_id: str, task_id: str,
-) -> dict[str, Any]:
-    """Mark a task as completed (status=2)."""
-    return await update_task(client, project_id, task_id, status=2)
+) -> dict[str, Any] | None:
+    """Mark a task as completed (status=2).
+
+    Uses TickTick's dedicated completion endpoint: a single request, no
+    fetch-and-merge of the full task. Returns the response body, which
+    TickTick currently leaves empty (None).
+    """
+    result = await client.post(f"project/{project_id}/task/{task_id}/complete")
+    _forget_task(client, project_id, task_id)
+    return result
+
+
+async def bulk_complete_tasks(
+    client: TickTickClient, items: list[tuple[str, str]],
+) -> list[dict[str, Any] | None | BaseException]:
+    """Mark several tasks completed concurrently.
+
+    ``items`` is a list of ``(project_id, task_id)`` pairs. Returns one
+    entry per pair, in order: the :func:`complete_task` result, or the
+    exception raised for that pair — one failure doesn't abort the others.
+    """
+    limit = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def _complete(project_id: str, task_id: str) -> dict[str, Any] | None:
+        async with limit:
+            return await complete_task(client, project_id, task_id)
+
+    return await asyncio.gather(
+        *(_complete(project_id, task_id) for project_id, task_id in items),
+        return_exceptions=True,
+    )
 
 
 async def delete_task(client: TickTickClient, project_id: str, task_id: str) -> None:
     """Permanently delete a task."""
     await client.delete(f"project/{project_id}/task/{task_id}")
+    _forget_task(client, project_id, task_id)